@@ -67,8 +67,8 @@ class DbmsClient:
         host_resolver: str = "roundrobin",
         resolver_max_tries: Optional[int] = None,
         http_client: Optional[HTTPClient] = None,
-        serializer: Callable[..., str] = lambda x: dumps(x),
-        deserializer: Callable[[str], Any] = lambda x: loads(x),
+        serializer: Callable[..., str] = dumps,
+        deserializer: Callable[[str], Any] = loads,
         verify_override: Union[bool, str, None] = None,
         request_timeout: Any = 60,
     ) -> None:
@@ -92,14 +92,17 @@ class BaseConnection:
     def prep_response(self, resp: Response, deserialize: bool = True) -> Response:
         """Populate the response with details and return it.
 
-        :param deserialize: Deserialize the response body.
+        :param deserialize: Deserialize the response body. Error responses
+            are deserialized regardless.
         :type deserialize: bool
         :param resp: HTTP response.
         :type resp: dbms.response.Response
         :return: HTTP response.
         :rtype: dbms.response.Response
         """
-        if deserialize:
+        http_ok = 200 <= resp.status_code < 300
+        # Error bodies are always deserialized so that error details survive.
+        if deserialize or not http_ok:
             resp.body = self.deserialize(resp.raw_body)
             if isinstance(resp.body, dict):
                 resp.error_code = resp.body.get("errorNum")
@@ -109,7 +112,6 @@ class BaseConnection:
         else:
             resp.body = resp.raw_body
 
-        http_ok = 200 <= resp.status_code < 300
         resp.is_success = http_ok and resp.error_code is None
         return resp
 
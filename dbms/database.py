@@ -2,7 +2,7 @@ __all__ = ["StandardDatabase", "AsyncDatabase", "BatchDatabase", "TransactionDat
 
 from datetime import datetime
 from numbers import Number
-from typing import Any, List, Optional, Sequence, Union
+from typing import Any, Dict, List, Optional, Sequence, Union
 
 from dbms.api import ApiGroup
 from dbms.sql import SQL
@@ -58,6 +58,7 @@ from dbms.exceptions import (
     UserUpdateError,
 )
 from dbms.executor import (
+    ApiExecutor,
     AsyncApiExecutor,
     BatchApiExecutor,
     DefaultApiExecutor,
@@ -83,6 +84,11 @@ from dbms.wal import WAL
 class Database(ApiGroup):
     """Base class for Database API wrappers."""
 
+    def __init__(self, connection: Connection, executor: ApiExecutor) -> None:
+        super().__init__(connection, executor)
+        self._relations: Dict[str, StandardRelation] = {}
+        self._sql: Optional[SQL] = None
+
     def __getitem__(self, name: str) -> StandardRelation:
         """Return the relation API wrapper.
 
@@ -102,7 +108,11 @@ class Database(ApiGroup):
         :rtype: dbms.relation.StandardRelation
         :raise dbms.exceptions.DocumentParseError: On malformed document.
         """
-        return self.relation(get_col_name(document))
+        name = get_col_name(document)
+        relation = self._relations.get(name)
+        if relation is None:
+            relation = self._relations[name] = self.relation(name)
+        return relation
 
     @property
     def name(self) -> str:
@@ -120,7 +130,9 @@ class Database(ApiGroup):
         :return: SQL API wrapper.
         :rtype: dbms.sql.SQL
         """
-        return SQL(self._conn, self._executor)
+        if self._sql is None:
+            self._sql = SQL(self._conn, self._executor)
+        return self._sql
 
     @property
     def wal(self) -> WAL:
@@ -69,6 +69,8 @@ class DefaultHTTPClient(HTTPClient):
     REQUEST_TIMEOUT = 60
     RETRY_ATTEMPTS = 3
     BACKOFF_FACTOR = 1
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 10
 
     def create_session(self, host: str) -> Session:
         """Create and return a new session/connection.
@@ -84,7 +86,11 @@ class DefaultHTTPClient(HTTPClient):
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["HEAD", "GET", "OPTIONS"],
         )
-        http_adapter = HTTPAdapter(max_retries=retry_strategy)
+        http_adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=retry_strategy,
+        )
 
         session = Session()
         session.mount("https://", http_adapter)
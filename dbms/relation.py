@@ -1,7 +1,9 @@
 __all__ = ["StandardRelation", "VertexRelation", "EdgeRelation"]
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from numbers import Number
-from typing import List, Optional, Sequence, Tuple, Union
+from typing import Deque, List, Optional, Sequence, Tuple, Union
 
 from dbms.api import ApiGroup
 from dbms.connection import Connection
@@ -43,6 +45,27 @@ from dbms.result import Result
 from dbms.typings import Fields, Headers, Json, Params
 from dbms.utils import get_batches, is_none_or_int, is_none_or_str
 
+# Server field names in relation statistics and their client-side aliases.
+_STATISTICS_FIELDS = {
+    "documentReferences": "document_refs",
+    "lastTick": "last_tick",
+    "waitingFor": "waiting_for",
+    "documentsSize": "documents_size",
+    "cacheInUse": "cache_in_use",
+    "cacheSize": "cache_size",
+    "cacheUsage": "cache_usage",
+    "uncollectedLogfileEntries": "uncollected_logfile_entries",
+}
+
+_FIND_IN_RANGE_QUERY = """
+FOR doc IN @@relation
+    FILTER doc.@field >= @lower && doc.@field < @upper
+    LIMIT @skip, @limit
+    RETURN doc
+"""
+
+_HAS_MANY_QUERY = "FOR handle IN @handles RETURN DOCUMENT(@@relation, handle) != null"
+
 
 class Relation(ApiGroup):
     """Base class for relation API wrappers.
@@ -69,6 +92,8 @@ class Relation(ApiGroup):
         super().__init__(connection, executor)
         self._name = name
         self._id_prefix = name + "/"
+        self._id_prefix_len = len(self._id_prefix)
+        self._document_path = f"/_api/document/{name}"
 
     def __iter__(self) -> Result[Cursor]:
         return self.all()
@@ -111,14 +136,16 @@ class Relation(ApiGroup):
         :rtype: str
         :raise dbms.exceptions.DocumentParseError: On missing ID and key.
         """
-        try:
-            if "_id" in body:
-                return self._validate_id(body["_id"])
-            else:
-                key: str = body["_key"]
-                return self._id_prefix + key
-        except KeyError:
-            raise DocumentParseError('field "_key" or "_id" required')
+        doc_id: Optional[str] = body.get("_id")
+        if doc_id is not None:
+            # Same check as _validate_id, inlined as this runs once per document.
+            if not doc_id.startswith(self._id_prefix):
+                raise DocumentParseError(f'bad relation name in document ID "{doc_id}"')
+            return doc_id
+        key: Optional[str] = body.get("_key")
+        if key is not None:
+            return self._id_prefix + key
+        raise DocumentParseError('field "_key" or "_id" required')
 
     def _prep_from_body(self, document: Json, check_rev: bool) -> Tuple[str, Headers]:
         """Prepare document ID and request headers.
@@ -152,21 +179,14 @@ class Relation(ApiGroup):
         if isinstance(document, dict):
             doc_id = self._extract_id(document)
             rev = rev or document.get("_rev")
-
-            if not check_rev or rev is None:
-                return doc_id, doc_id, {}
-            else:
-                return doc_id, doc_id, {"If-Match": rev}
+        elif "/" in document:
+            doc_id = self._validate_id(document)
         else:
-            if "/" in document:
-                doc_id = self._validate_id(document)
-            else:
-                doc_id = self._id_prefix + document
+            doc_id = self._id_prefix + document
 
-            if not check_rev or rev is None:
-                return doc_id, doc_id, {}
-            else:
-                return doc_id, doc_id, {"If-Match": rev}
+        if not check_rev or rev is None:
+            return doc_id, doc_id, {}
+        return doc_id, doc_id, {"If-Match": rev}
 
     def _ensure_key_in_body(self, body: Json) -> Json:
         """Return the document body with "_key" field populated.
@@ -179,10 +199,11 @@ class Relation(ApiGroup):
         """
         if "_key" in body:
             return body
-        elif "_id" in body:
-            doc_id = self._validate_id(body["_id"])
+        doc_id = body.get("_id")
+        if doc_id is not None:
+            self._validate_id(doc_id)
             body = body.copy()
-            body["_key"] = doc_id[len(self._id_prefix) :]
+            body["_key"] = doc_id[self._id_prefix_len :]
             return body
         raise DocumentParseError('field "_key" or "_id" required')
 
@@ -194,10 +215,11 @@ class Relation(ApiGroup):
         :return: Document body with "_key" field if it has "_id" field.
         :rtype: dict
         """
-        if "_id" in body and "_key" not in body:
-            doc_id = self._validate_id(body["_id"])
+        doc_id = body.get("_id")
+        if doc_id is not None and "_key" not in body:
+            self._validate_id(doc_id)
             body = body.copy()
-            body["_key"] = doc_id[len(self._id_prefix) :]
+            body["_key"] = doc_id[self._id_prefix_len :]
         return body
 
     @property
@@ -275,6 +297,8 @@ class Relation(ApiGroup):
                 raise RelationRenameError(resp, request)
             self._name = new_name
             self._id_prefix = new_name + "/"
+            self._id_prefix_len = len(self._id_prefix)
+            self._document_path = f"/_api/document/{new_name}"
             return True
 
         return self._execute(request, response_handler)
@@ -372,25 +396,7 @@ class Relation(ApiGroup):
                 raise RelationStatisticsError(resp, request)
 
             stats: Json = resp.body.get("figures", resp.body)
-            if "documentReferences" in stats:  # pragma: no cover
-                stats["document_refs"] = stats.pop("documentReferences")
-            if "lastTick" in stats:  # pragma: no cover
-                stats["last_tick"] = stats.pop("lastTick")
-            if "waitingFor" in stats:  # pragma: no cover
-                stats["waiting_for"] = stats.pop("waitingFor")
-            if "documentsSize" in stats:  # pragma: no cover
-                stats["documents_size"] = stats.pop("documentsSize")
-            if "cacheInUse" in stats:  # pragma: no cover
-                stats["cache_in_use"] = stats.pop("cacheInUse")
-            if "cacheSize" in stats:  # pragma: no cover
-                stats["cache_size"] = stats.pop("cacheSize")
-            if "cacheUsage" in stats:  # pragma: no cover
-                stats["cache_usage"] = stats.pop("cacheUsage")
-            if "uncollectedLogfileEntries" in stats:  # pragma: no cover
-                stats["uncollected_logfile_entries"] = stats.pop(
-                    "uncollectedLogfileEntries"
-                )
-            return stats
+            return {_STATISTICS_FIELDS.get(k, k): v for k, v in stats.items()}
 
         return self._execute(request, response_handler)
 
@@ -547,6 +553,51 @@ class Relation(ApiGroup):
 
         return self._execute(request, response_handler)
 
+    def has_many(self, documents: Sequence[Union[str, Json]]) -> Result[List[bool]]:
+        """Check if multiple documents exist in the relation.
+
+        Document revisions are not checked.
+
+        :param documents: List of document keys, IDs or bodies. Document bodies
+            must contain the "_id" or "_key" fields.
+        :type documents: [str | dict]
+        :return: True or False for each document, in the order given.
+        :rtype: [bool]
+        :raise dbms.exceptions.DocumentInError: If check fails.
+        """
+        extract_id = self._extract_id
+        validate_id = self._validate_id
+        id_prefix = self._id_prefix
+
+        handles = []
+        for doc in documents:
+            if isinstance(doc, dict):
+                handles.append(extract_id(doc))
+            elif "/" in doc:
+                handles.append(validate_id(doc))
+            else:
+                handles.append(id_prefix + doc)
+
+        bind_vars = {"@relation": self._name, "handles": handles}
+
+        request = Request(
+            method="post",
+            endpoint="/_api/cursor",
+            data={
+                "query": _HAS_MANY_QUERY,
+                "bindVars": bind_vars,
+                "batchSize": max(len(handles), 1),
+            },
+            read=self.name,
+        )
+
+        def response_handler(resp: Response) -> List[bool]:
+            if not resp.is_success:
+                raise DocumentInError(resp, request)
+            return list(Cursor(self._conn, resp.body))
+
+        return self._execute(request, response_handler)
+
     def ids(self) -> Result[Cursor]:
         """Return the IDs of all documents in the relation.
 
@@ -698,17 +749,10 @@ class Relation(ApiGroup):
             "limit": 2147483647 if limit is None else limit,  # 2 ^ 31 - 1
         }
 
-        query = """
-        FOR doc IN @@relation
-            FILTER doc.@field >= @lower && doc.@field < @upper
-            LIMIT @skip, @limit
-            RETURN doc
-        """
-
         request = Request(
             method="post",
             endpoint="/_api/cursor",
-            data={"query": query, "bindVars": bind_vars, "count": True},
+            data={"query": _FIND_IN_RANGE_QUERY, "bindVars": bind_vars, "count": True},
             read=self.name,
         )
 
@@ -729,13 +773,14 @@ class Relation(ApiGroup):
         :rtype: [dict]
         :raise dbms.exceptions.DocumentGetError: If retrieval fails.
         """
-        handles = [self._extract_id(d) if isinstance(d, dict) else d for d in documents]
+        extract_id = self._extract_id
+        handles = [extract_id(d) if isinstance(d, dict) else d for d in documents]
 
         params: Params = {"onlyget": True}
 
         request = Request(
             method="put",
-            endpoint=f"/_api/document/{self.name}",
+            endpoint=self._document_path,
             params=params,
             data=handles,
             read=self.name,
@@ -791,7 +836,7 @@ class Relation(ApiGroup):
             if not resp.is_success:
                 raise IndexListError(resp, request)
             result = resp.body["indexes"]
-            return [format_index(index) for index in result]
+            return list(map(format_index, result))
 
         return self._execute(request, response_handler)
 
@@ -913,7 +958,7 @@ class Relation(ApiGroup):
         sparse: Optional[bool] = None,
         name: Optional[str] = None,
         in_background: Optional[bool] = None,
-        storedValues: Sequence[str] = [],
+        storedValues: Optional[Sequence[str]] = None,
         cacheEnabled: Optional[bool] = None,
     ) -> Result[Json]:
         """Create a new persistent index.
@@ -939,7 +984,7 @@ class Relation(ApiGroup):
             an array of index attribute paths. There must be no overlap of
             attribute paths between fields and storedValues. The maximum
             number of values is 32.
-        :type storedValues: [str]
+        :type storedValues: [str] | None
         :param cacheEnabled: Enable an in-memory cache for index values for
             persistent indexes.
         :type cacheEnabled: bool | None
@@ -1098,7 +1143,8 @@ class Relation(ApiGroup):
         :rtype: [dict | DbmsServerError] | bool
         :raise dbms.exceptions.DocumentInsertError: If insert fails.
         """
-        documents = [self._ensure_key_from_id(doc) for doc in documents]
+        ensure_key = self._ensure_key_from_id
+        documents = [doc if "_key" in doc else ensure_key(doc) for doc in documents]
 
         params: Params = {
             "returnNew": return_new,
@@ -1118,9 +1164,10 @@ class Relation(ApiGroup):
 
         request = Request(
             method="post",
-            endpoint=f"/_api/document/{self.name}",
+            endpoint=self._document_path,
             data=documents,
             params=params,
+            deserialize=not silent,
         )
 
         def response_handler(
@@ -1194,26 +1241,29 @@ class Relation(ApiGroup):
         :rtype: [dict | DbmsError] | bool
         :raise dbms.exceptions.DocumentUpdateError: If update fails.
         """
+        ignore_revs = not check_rev
         params: Params = {
             "keepNull": keep_none,
             "mergeObjects": merge,
             "returnNew": return_new,
             "returnOld": return_old,
-            "ignoreRevs": not check_rev,
-            "overwrite": not check_rev,
+            "ignoreRevs": ignore_revs,
+            "overwrite": ignore_revs,
             "silent": silent,
         }
         if sync is not None:
             params["waitForSync"] = sync
 
-        documents = [self._ensure_key_in_body(doc) for doc in documents]
+        ensure_key = self._ensure_key_in_body
+        documents = [doc if "_key" in doc else ensure_key(doc) for doc in documents]
 
         request = Request(
             method="patch",
-            endpoint=f"/_api/document/{self.name}",
+            endpoint=self._document_path,
             data=documents,
             params=params,
             write=self.name,
+            deserialize=not silent,
         )
 
         def response_handler(
@@ -1227,7 +1277,8 @@ class Relation(ApiGroup):
             results = []
             for body in resp.body:
                 if "_id" in body:
-                    body["_old_rev"] = body.pop("_oldRev")
+                    if "_oldRev" in body:
+                        body["_old_rev"] = body.pop("_oldRev")
                     results.append(body)
                 else:
                     sub_resp = self._conn.prep_bulk_err_response(resp, body)
@@ -1344,24 +1395,27 @@ class Relation(ApiGroup):
         :rtype: [dict | DbmsServerError] | bool
         :raise dbms.exceptions.DocumentReplaceError: If replace fails.
         """
+        ignore_revs = not check_rev
         params: Params = {
             "returnNew": return_new,
             "returnOld": return_old,
-            "ignoreRevs": not check_rev,
-            "overwrite": not check_rev,
+            "ignoreRevs": ignore_revs,
+            "overwrite": ignore_revs,
             "silent": silent,
         }
         if sync is not None:
             params["waitForSync"] = sync
 
-        documents = [self._ensure_key_in_body(doc) for doc in documents]
+        ensure_key = self._ensure_key_in_body
+        documents = [doc if "_key" in doc else ensure_key(doc) for doc in documents]
 
         request = Request(
             method="put",
-            endpoint=f"/_api/document/{self.name}",
+            endpoint=self._document_path,
             params=params,
             data=documents,
             write=self.name,
+            deserialize=not silent,
         )
 
         def response_handler(
@@ -1375,7 +1429,8 @@ class Relation(ApiGroup):
             results: List[Union[Json, DbmsServerError]] = []
             for body in resp.body:
                 if "_id" in body:
-                    body["_old_rev"] = body.pop("_oldRev")
+                    if "_oldRev" in body:
+                        body["_old_rev"] = body.pop("_oldRev")
                     results.append(body)
                 else:
                     sub_resp = self._conn.prep_bulk_err_response(resp, body)
@@ -1471,26 +1526,29 @@ class Relation(ApiGroup):
         :rtype: [dict | DbmsServerError] | bool
         :raise dbms.exceptions.DocumentDeleteError: If delete fails.
         """
+        ignore_revs = not check_rev
         params: Params = {
             "returnOld": return_old,
-            "ignoreRevs": not check_rev,
-            "overwrite": not check_rev,
+            "ignoreRevs": ignore_revs,
+            "overwrite": ignore_revs,
             "silent": silent,
         }
         if sync is not None:
             params["waitForSync"] = sync
 
+        ensure_key = self._ensure_key_in_body
         documents = [
-            self._ensure_key_in_body(doc) if isinstance(doc, dict) else doc
+            ensure_key(doc) if isinstance(doc, dict) and "_key" not in doc else doc
             for doc in documents
         ]
 
         request = Request(
             method="delete",
-            endpoint=f"/_api/document/{self.name}",
+            endpoint=self._document_path,
             params=params,
             data=documents,
             write=self.name,
+            deserialize=not silent,
         )
 
         def response_handler(
@@ -1567,6 +1625,7 @@ class Relation(ApiGroup):
         on_duplicate: Optional[str] = None,
         sync: Optional[bool] = None,
         batch_size: Optional[int] = None,
+        max_workers: int = 1,
     ) -> Union[Result[Json], List[Result[Json]]]:
         """Insert multiple documents into the relation.
 
@@ -1619,6 +1678,18 @@ class Relation(ApiGroup):
             depending on the return value if possible. Cannot be used with
             parameter **overwrite**.
         :type batch_size: int
+        :param max_workers: Number of batches to import concurrently when
+            **batch_size** is specified. At most **max_workers** batches are
+            in flight at a time and results are returned in batch order. If a
+            batch fails, no further batches are started, the batches already
+            in flight are allowed to finish, and the error is raised; batches
+            before the failed one stay imported, as with sequential imports.
+            Keep this at or below the connection pool size of the HTTP client
+            (10 for :class:`dbms.http.DefaultHTTPClient`), otherwise surplus
+            connections are discarded after each request. Applies only to the
+            default API execution context; batches are imported one at a time
+            otherwise.
+        :type max_workers: int
         :return: Result of the bulk import.
         :rtype: dict | list[dict]
         :raise dbms.exceptions.DocumentInsertError: If import fails.
@@ -1627,7 +1698,8 @@ class Relation(ApiGroup):
             msg = "Cannot use parameter 'batch_size' if 'overwrite' is set to True"
             raise ValueError(msg)
 
-        documents = [self._ensure_key_from_id(doc) for doc in documents]
+        ensure_key = self._ensure_key_from_id
+        documents = [doc if "_key" in doc else ensure_key(doc) for doc in documents]
 
         params: Params = {"type": "array", "relation": self.name}
         if halt_on_error is not None:
@@ -1645,35 +1717,40 @@ class Relation(ApiGroup):
         if sync is not None:
             params["waitForSync"] = sync
 
-        def response_handler(resp: Response) -> Json:
-            if resp.is_success:
-                result: Json = resp.body
-                return result
-            raise DocumentInsertError(resp, request)
-
-        if batch_size is None:
+        def import_batch(batch: Sequence[Json]) -> Result[Json]:
             request = Request(
                 method="post",
                 endpoint="/_api/import",
-                data=documents,
+                data=batch,
                 params=params,
                 write=self.name,
             )
 
+            def response_handler(resp: Response) -> Json:
+                if resp.is_success:
+                    result: Json = resp.body
+                    return result
+                raise DocumentInsertError(resp, request)
+
             return self._execute(request, response_handler)
-        else:
-            results = []
-            for batch in get_batches(documents, batch_size):
-                request = Request(
-                    method="post",
-                    endpoint="/_api/import",
-                    data=batch,
-                    params=params,
-                    write=self.name,
-                )
-                results.append(self._execute(request, response_handler))
 
-            return results
+        if batch_size is None:
+            return import_batch(documents)
+
+        batches = get_batches(documents, batch_size)
+        if max_workers <= 1 or self.context != "default":
+            return [import_batch(batch) for batch in batches]
+
+        results: List[Result[Json]] = []
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            in_flight: Deque["Future[Result[Json]]"] = deque()
+            for batch in batches:
+                if len(in_flight) == max_workers:
+                    results.append(in_flight.popleft().result())
+                in_flight.append(pool.submit(import_batch, batch))
+            while in_flight:
+                results.append(in_flight.popleft().result())
+        return results
 
 
 class StandardRelation(Relation):
@@ -1798,10 +1875,11 @@ class StandardRelation(Relation):
 
         request = Request(
             method="post",
-            endpoint=f"/_api/document/{self.name}",
+            endpoint=self._document_path,
             data=document,
             params=params,
             write=self.name,
+            deserialize=not silent,
         )
 
         def response_handler(resp: Response) -> Union[bool, Json]:
@@ -1860,24 +1938,29 @@ class StandardRelation(Relation):
         :raise dbms.exceptions.DocumentUpdateError: If update fails.
         :raise dbms.exceptions.DocumentRevisionError: If revisions mismatch.
         """
+        ignore_revs = not check_rev
         params: Params = {
             "keepNull": keep_none,
             "mergeObjects": merge,
             "returnNew": return_new,
             "returnOld": return_old,
-            "ignoreRevs": not check_rev,
-            "overwrite": not check_rev,
+            "ignoreRevs": ignore_revs,
+            "overwrite": ignore_revs,
             "silent": silent,
         }
         if sync is not None:
             params["waitForSync"] = sync
 
+        doc_id, headers = self._prep_from_body(document, check_rev)
+
         request = Request(
             method="patch",
-            endpoint=f"/_api/document/{self._extract_id(document)}",
+            endpoint=f"/_api/document/{doc_id}",
             data=document,
             params=params,
+            headers=headers,
             write=self.name,
+            deserialize=not silent,
         )
 
         def response_handler(resp: Response) -> Union[bool, Json]:
@@ -1929,22 +2012,27 @@ class StandardRelation(Relation):
         :raise dbms.exceptions.DocumentReplaceError: If replace fails.
         :raise dbms.exceptions.DocumentRevisionError: If revisions mismatch.
         """
+        ignore_revs = not check_rev
         params: Params = {
             "returnNew": return_new,
             "returnOld": return_old,
-            "ignoreRevs": not check_rev,
-            "overwrite": not check_rev,
+            "ignoreRevs": ignore_revs,
+            "overwrite": ignore_revs,
             "silent": silent,
         }
         if sync is not None:
             params["waitForSync"] = sync
 
+        doc_id, headers = self._prep_from_body(document, check_rev)
+
         request = Request(
             method="put",
-            endpoint=f"/_api/document/{self._extract_id(document)}",
+            endpoint=f"/_api/document/{doc_id}",
             params=params,
             data=document,
+            headers=headers,
             write=self.name,
+            deserialize=not silent,
         )
 
         def response_handler(resp: Response) -> Union[bool, Json]:
@@ -2006,10 +2094,11 @@ class StandardRelation(Relation):
         """
         handle, body, headers = self._prep_from_doc(document, rev, check_rev)
 
+        ignore_revs = not check_rev
         params: Params = {
             "returnOld": return_old,
-            "ignoreRevs": not check_rev,
-            "overwrite": not check_rev,
+            "ignoreRevs": ignore_revs,
+            "overwrite": ignore_revs,
             "silent": silent,
         }
         if sync is not None:
@@ -2021,6 +2110,7 @@ class StandardRelation(Relation):
             params=params,
             headers=headers,
             write=self.name,
+            deserialize=not silent,
         )
 
         def response_handler(resp: Response) -> Union[bool, Json]:
@@ -154,6 +154,7 @@ class SQL(ApiGroup):
 
     def __init__(self, connection: Connection, executor: ApiExecutor) -> None:
         super().__init__(connection, executor)
+        self._cache: Optional[SQLQueryCache] = None
 
     def __repr__(self) -> str:
         return f"<SQL in {self._conn.db_name}>"
@@ -165,7 +166,9 @@ class SQL(ApiGroup):
         :return: Query cache API wrapper.
         :rtype: dbms.sql.SQLQueryCache
         """
-        return SQLQueryCache(self._conn, self._executor)
+        if self._cache is None:
+            self._cache = SQLQueryCache(self._conn, self._executor)
+        return self._cache
 
     def explain(
         self,
@@ -647,9 +650,6 @@ class SQL(ApiGroup):
                 raise SQLQueryRulesGetError(resp, request)
 
             rules: Jsons = resp.body
-            items: Jsons = []
-            for rule in rules:
-                items.append(format_query_rule_item(rule))
-            return items
+            return list(map(format_query_rule_item, rules))
 
         return self._execute(request, response_handler)
@@ -41,7 +41,7 @@ def get_col_name(doc: Union[str, Json]) -> str:
     except KeyError:
         raise DocumentParseError('field "_id" required')
     else:
-        return doc_id.split("/", 1)[0]
+        return doc_id.partition("/")[0]
 
 
 def is_none_or_int(obj: Any) -> bool:
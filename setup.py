@@ -34,6 +34,7 @@ setup(
             "pre-commit>=2.17.0",
             "pytest>=7.1.1",
             "pytest-cov>=3.0.0",
+            "pytest-xdist",
             "sphinx",
             "sphinx_rtd_theme",
             "types-pkg_resources",
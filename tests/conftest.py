@@ -1,9 +1,16 @@
+import cProfile
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from typing import List
 
 import pytest
 
 from dbms import DbmsClient, formatter
 from dbms.database import StandardDatabase
+from dbms.exceptions import DbmsError
+from dbms.http import DefaultHTTPClient
 from dbms.typings import Json
 from tests.executors import (
     TestAsyncApiExecutor,
@@ -30,6 +37,8 @@ class GlobalData:
     sys_db: StandardDatabase = None
     tst_db: StandardDatabase = None
     bad_db: StandardDatabase = None
+    tst_dbs: List[StandardDatabase] = None
+    bad_dbs: List[StandardDatabase] = None
     col_name: str = None
     icol_name: str = None
     ecol_name: str = None
@@ -55,9 +64,19 @@ def pytest_addoption(parser):
     parser.addoption("--replication", action="store_true")
     parser.addoption("--enterprise", action="store_true")
     parser.addoption("--secret", action="store", default="secret")
+    parser.addoption("--profile-dir", action="store", default=None)
 
 
 def pytest_configure(config):
+    # The test async executor polls jobs that test_async clears server-wide.
+    if config.getoption("complete") and getattr(config.option, "numprocesses", None):
+        raise pytest.UsageError("--complete cannot be combined with pytest-xdist")
+
+    # Registered here as well so that runs without pytest-xdist do not warn.
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests of a group in the same worker"
+    )
+
     url = f"http://{config.getoption('dbhost')}:{config.getoption('dbport')}"
     secret = config.getoption("secret")
     client = DbmsClient(hosts=[url, url, url])
@@ -105,6 +124,8 @@ def pytest_configure(config):
     global_data.sys_db = sys_db
     global_data.tst_db = tst_db
     global_data.bad_db = bad_db
+    if config.getoption("complete"):
+        global_data.tst_dbs, global_data.bad_dbs = _build_executor_dbs(tst_db, bad_db)
     global_data.col_name = col_name
     global_data.icol_name = icol_name
     global_data.cluster = config.getoption("cluster")
@@ -115,83 +136,162 @@ def pytest_configure(config):
     global_data.root_password = config.getoption("passwd")
 
 
+def _delete_all(delete, names, prefix):  # pragma: no cover
+    """Concurrently delete every name that starts with the given prefix.
+
+    Missing items are expected to be ignored by **delete** itself. Other errors
+    are collected rather than raised, so one failed deletion does not stop
+    the others.
+
+    :param delete: Callable that deletes a single item by name.
+    :type delete: callable
+    :param names: Names of existing items.
+    :type names: [str]
+    :param prefix: Prefix of the names to delete.
+    :type prefix: str
+    :return: Errors raised by the failed deletions.
+    :rtype: [dbms.exceptions.DbmsError]
+    """
+
+    def delete_one(name):
+        try:
+            delete(name)
+        except DbmsError as err:
+            return err
+        return None
+
+    names = [name for name in names if name.startswith(prefix)]
+    with ThreadPoolExecutor(max_workers=DefaultHTTPClient.POOL_MAXSIZE) as pool:
+        return [err for err in pool.map(delete_one, names) if err is not None]
+
+
 # noinspection PyShadowingNames
-def pytest_unconfigure(*_):  # pragma: no cover
+def pytest_unconfigure(config):  # pragma: no cover
     sys_db = global_data.sys_db
     if sys_db is None:
         return
 
-    # Remove all test async jobs.
-    sys_db.clear_async_jobs()
-
-    # Remove all test tasks.
-    for task in sys_db.tasks():
-        task_name = task["name"]
-        if task_name.startswith("test_task"):
-            sys_db.delete_task(task_name, ignore_missing=True)
-
-    # Remove all test users.
-    for user in sys_db.users():
-        username = user["username"]
-        if username.startswith("test_user"):
-            sys_db.delete_user(username, ignore_missing=True)
+    # With pytest-xdist, each worker has its own test database and relations,
+    # but the cleanup below is prefix-based and would remove those of workers
+    # still running. Leave it to the controller, which finishes last.
+    if hasattr(config, "workerinput"):
+        global_data.client.close()
+        return
 
-    # Remove all test databases.
-    for db_name in sys_db.databases():
-        if db_name.startswith("test_database"):
-            sys_db.delete_database(db_name, ignore_missing=True)
+    # Test tasks, users, databases and relations to remove, as tuples of
+    # (delete callable, callable listing names, name prefix).
+    cleanups = [
+        (
+            lambda name: sys_db.delete_task(name, ignore_missing=True),
+            lambda: [task["name"] for task in sys_db.tasks()],
+            "test_task",
+        ),
+        (
+            lambda name: sys_db.delete_user(name, ignore_missing=True),
+            lambda: [user["username"] for user in sys_db.users()],
+            "test_user",
+        ),
+        (
+            lambda name: sys_db.delete_database(name, ignore_missing=True),
+            sys_db.databases,
+            "test_database",
+        ),
+        (
+            lambda name: sys_db.delete_relation(name, ignore_missing=True),
+            lambda: [relation["name"] for relation in sys_db.relations()],
+            "test_relation",
+        ),
+    ]
 
-    # Remove all test relations.
-    for relation in sys_db.relations():
-        col_name = relation["name"]
-        if col_name.startswith("test_relation"):
-            sys_db.delete_relation(col_name, ignore_missing=True)
+    # Keep cleaning up after a failure and report all the errors at the end.
+    errors = []
+    try:
+        # Remove all test async jobs.
+        try:
+            sys_db.clear_async_jobs()
+        except DbmsError as err:
+            errors.append(err)
+
+        for delete, list_names, prefix in cleanups:
+            try:
+                errors.extend(_delete_all(delete, list_names(), prefix))
+            except DbmsError as err:
+                errors.append(err)
+
+        # Remove all backups.
+        if global_data.enterprise:
+            try:
+                for backup_id in sys_db.backup.get()["list"].keys():
+                    sys_db.backup.delete(backup_id)
+            except DbmsError as err:
+                errors.append(err)
+    finally:
+        global_data.client.close()
+
+    if errors:
+        details = "\n".join(f"{type(err).__name__}: {err}" for err in errors)
+        raise RuntimeError(f"Test cleanup failed:\n{details}") from errors[0]
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):  # pragma: no cover
+    profile_dir = item.config.getoption("profile_dir")
+    if profile_dir is None:
+        yield
+        return
 
-    # # Remove all backups.
-    if global_data.enterprise:
-        for backup_id in sys_db.backup.get()["list"].keys():
-            sys_db.backup.delete(backup_id)
+    # Profile the whole protocol so that fixture setup and teardown, where
+    # most of the server round trips happen, show up in the stats as well.
+    profiler = cProfile.Profile()
+    profiler.enable()
+    yield
+    profiler.disable()
 
-    global_data.client.close()
+    os.makedirs(profile_dir, exist_ok=True)
+    file_name = re.sub(r"[^\w.-]+", "_", item.nodeid) + ".prof"
+    profiler.dump_stats(os.path.join(profile_dir, file_name))
 
 
 # noinspection PyProtectedMember
-def pytest_generate_tests(metafunc):
-    tst_db = global_data.tst_db
-    bad_db = global_data.bad_db
-
+def _build_executor_dbs(tst_db, bad_db):
+    """Return test/bad databases wired to each of the test executors.
+
+    :param tst_db: Test database using the default executor.
+    :type tst_db: dbms.database.StandardDatabase
+    :param bad_db: Bad database using the default executor.
+    :type bad_db: dbms.database.StandardDatabase
+    :return: Lists of test and bad databases, default executor first.
+    :rtype: (list, list)
+    """
     tst_dbs = [tst_db]
     bad_dbs = [bad_db]
+    tst_conn = tst_db._conn
+    bad_conn = bad_db._conn
+
+    for executor_cls in (
+        TestTransactionApiExecutor,
+        TestAsyncApiExecutor,
+        TestBatchExecutor,
+    ):
+        alt_tst_db = StandardDatabase(tst_conn)
+        alt_tst_db._executor = executor_cls(tst_conn)
+        tst_dbs.append(alt_tst_db)
+        alt_bad_db = StandardDatabase(bad_conn)
+        alt_bad_db._executor = executor_cls(bad_conn)
+        bad_dbs.append(alt_bad_db)
+
+    return tst_dbs, bad_dbs
+
+
+def pytest_generate_tests(metafunc):
+    tst_dbs = [global_data.tst_db]
+    bad_dbs = [global_data.bad_db]
 
     if global_data.complete:
         test = metafunc.module.__name__.split(".test_", 1)[-1]
-        tst_conn = tst_db._conn
-        bad_conn = bad_db._conn
-
         if test in {"sql", "relation", "document", "index"}:
-            # Add test transaction databases
-            tst_txn_db = StandardDatabase(tst_conn)
-            tst_txn_db._executor = TestTransactionApiExecutor(tst_conn)
-            tst_dbs.append(tst_txn_db)
-            bad_txn_db = StandardDatabase(bad_conn)
-            bad_txn_db._executor = TestTransactionApiExecutor(bad_conn)
-            bad_dbs.append(bad_txn_db)
-
-            # Add test async databases
-            tst_async_db = StandardDatabase(tst_conn)
-            tst_async_db._executor = TestAsyncApiExecutor(tst_conn)
-            tst_dbs.append(tst_async_db)
-            bad_async_db = StandardDatabase(bad_conn)
-            bad_async_db._executor = TestAsyncApiExecutor(bad_conn)
-            bad_dbs.append(bad_async_db)
-
-            # Add test batch databases
-            tst_batch_db = StandardDatabase(tst_conn)
-            tst_batch_db._executor = TestBatchExecutor(tst_conn)
-            tst_dbs.append(tst_batch_db)
-            bad_batch_bdb = StandardDatabase(bad_conn)
-            bad_batch_bdb._executor = TestBatchExecutor(bad_conn)
-            bad_dbs.append(bad_batch_bdb)
+            tst_dbs = global_data.tst_dbs
+            bad_dbs = global_data.bad_dbs
 
     if "db" in metafunc.fixturenames and "bad_db" in metafunc.fixturenames:
         metafunc.parametrize("db,bad_db", zip(tst_dbs, bad_dbs))
@@ -203,23 +303,29 @@ def pytest_generate_tests(metafunc):
         metafunc.parametrize("bad_db", bad_dbs)
 
 
-@pytest.fixture(autouse=True)
-def mock_formatters(monkeypatch):
+# Server fields that the formatters intentionally drop or do not handle yet.
+# FIXME: make sure that we really need to strip "database" and "relations"
+_STRIP_BODY = (
+    "error",
+    "code",
+    "collections",
+    "estimates",
+    "internalValidatorType",
+    "useMemoryMaps",
+    "parallelism",
+    "masterContext",
+    "database",
+)
+_STRIP_RESULT = ("edge", "database", "relations")
+
+
+@pytest.fixture(autouse=True, scope="session")
+def mock_formatters():
     def mock_verify_format(body, result):
-        body.pop("error", None)
-        body.pop("code", None)
-        result.pop("edge", None)
-
-        # FIXME: make sure that we really need to do that
-        result.pop("database", None)
-        result.pop("relations", None)
-        body.pop("collections", None)
-        body.pop("estimates", None)
-        body.pop("internalValidatorType", None)
-        body.pop("useMemoryMaps", None)
-        body.pop("parallelism", None)
-        body.pop("masterContext", None)
-        body.pop("database", None)
+        for field in _STRIP_BODY:
+            body.pop(field, None)
+        for field in _STRIP_RESULT:
+            result.pop(field, None)
         if "computedValues" in body and body["computedValues"] is None:
             body.pop("computedValues")
         if len(body) != len(result):
@@ -228,7 +334,9 @@ def mock_formatters(monkeypatch):
             raise ValueError(f"\nIN: {before}\nOUT: {after}")
         return result
 
-    monkeypatch.setattr(formatter, "verify_format", mock_verify_format)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(formatter, "verify_format", mock_verify_format)
+        yield
 
 
 @pytest.fixture(autouse=False)
@@ -1,5 +1,7 @@
 import time
 from collections import deque
+from itertools import count
+from operator import itemgetter
 from uuid import uuid4
 
 import jwt
@@ -8,77 +10,103 @@ import pytest
 from dbms.cursor import Cursor
 from dbms.exceptions import AsyncExecuteError, BatchExecuteError, TransactionInitError
 
+# Names only need to be unique, so draw on the OS RNG once per process and
+# append a counter instead of calling uuid4() for every generated name.
+_run_id = uuid4().hex[:12]
+_counter = count()
+
+# Tests that change or assert on server-wide state (async jobs, log levels,
+# query tracking, the query cache, replication, backups, maintenance mode).
+# With "pytest -n auto --dist loadgroup" they run one after another in the
+# same worker; unmarked tests in other workers still run alongside them.
+shared_server_state = pytest.mark.xdist_group(name="shared_server_state")
+
+# System keys kept by clean_doc.
+_KEEP_SYSTEM_KEYS = frozenset(("_key", "_from", "_to"))
+
+
+def _unique_suffix():
+    """Return a name suffix that is unique within and across test runs.
+
+    The suffix is the per-process run ID followed by a hex counter, e.g.
+    "3f2a9c1b7d04_0000002a".
+
+    :return: Unique name suffix.
+    :rtype: str
+    """
+    return f"{_run_id}_{next(_counter):08x}"
+
 
 def generate_db_name():
-    """Generate and return a random database name.
+    """Generate and return a unique database name.
 
-    :return: Random database name.
+    :return: Unique database name.
     :rtype: str
     """
-    return f"test_database_{uuid4().hex}"
+    return f"test_database_{_unique_suffix()}"
 
 
 def generate_col_name():
-    """Generate and return a random relation name.
+    """Generate and return a unique relation name.
 
-    :return: Random relation name.
+    :return: Unique relation name.
     :rtype: str
     """
-    return f"test_relation_{uuid4().hex}"
+    return f"test_relation_{_unique_suffix()}"
 
 
 def generate_doc_key():
-    """Generate and return a random document key.
+    """Generate and return a unique document key.
 
-    :return: Random document key.
+    :return: Unique document key.
     :rtype: str
     """
-    return f"test_document_{uuid4().hex}"
+    return f"test_document_{_unique_suffix()}"
 
 
 def generate_task_name():
-    """Generate and return a random task name.
+    """Generate and return a unique task name.
 
-    :return: Random task name.
+    :return: Unique task name.
     :rtype: str
     """
-    return f"test_task_{uuid4().hex}"
+    return f"test_task_{_unique_suffix()}"
 
 
 def generate_task_id():
-    """Generate and return a random task ID.
+    """Generate and return a unique task ID.
 
-    :return: Random task ID
+    :return: Unique task ID
     :rtype: str
     """
-    return f"test_task_id_{uuid4().hex}"
+    return f"test_task_id_{_unique_suffix()}"
 
 
 def generate_username():
-    """Generate and return a random username.
+    """Generate and return a unique username.
 
-    :return: Random username.
+    :return: Unique username.
     :rtype: str
     """
-    return f"test_user_{uuid4().hex}"
+    return f"test_user_{_unique_suffix()}"
 
 
 def generate_string():
-    """Generate and return a random unique string.
+    """Generate and return a unique string.
 
-    :return: Random unique string.
+    :return: Unique string.
     :rtype: str
     """
-    return uuid4().hex
+    return _unique_suffix()
 
 
 def generate_service_mount():
-    """Generate and return a random service name.
+    """Generate and return a unique service name.
 
-    :return: Random service name.
+    :return: Unique service name.
     :rtype: str
     """
-    return f"/test_{uuid4().hex}"
+    return f"/test_{_unique_suffix()}"
 
 
 def generate_jwt(secret, exp=3600):
@@ -111,17 +139,41 @@ def clean_doc(obj):
     :return: Document(s) with the system keys stripped
     :rtype: list | dict
     """
-    if isinstance(obj, (Cursor, list, deque)):
-        docs = [clean_doc(d) for d in obj]
-        return sorted(docs, key=lambda doc: doc["_key"])
 
-    if isinstance(obj, dict):
+    def strip_system_keys(doc):
         return {
             field: value
-            for field, value in obj.items()
-            if field in {"_key", "_from", "_to"} or not field.startswith("_")
+            for field, value in doc.items()
+            if field in _KEEP_SYSTEM_KEYS or field[:1] != "_"
         }
 
+    if isinstance(obj, dict):
+        return strip_system_keys(obj)
+
+    if isinstance(obj, (Cursor, list, deque)):
+        docs = [strip_system_keys(doc) for doc in obj]
+        return sorted(docs, key=itemgetter("_key"))
+
+
+def poll_until(predicate, timeout=10):
+    """Call the predicate with exponential backoff until it returns True.
+
+    :param predicate: Callable that takes no arguments.
+    :type predicate: callable
+    :param timeout: Maximum time to wait in seconds.
+    :type timeout: int | float
+    :return: True if the predicate returned True before the timeout.
+    :rtype: bool
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while not predicate():
+        if time.monotonic() >= deadline:
+            return False  # pragma: no cover
+        time.sleep(delay)
+        delay = min(delay * 2, 0.2)
+    return True
+
 
 def empty_relation(relation):
     """Empty all the documents in the relation.
@@ -130,8 +182,7 @@ def empty_relation(relation):
     :type relation: dbms.relation.StandardRelation |
         dbms.relation.VertexRelation | dbms.relation.EdgeRelation
     """
-    for doc_id in relation.ids():
-        relation.delete(doc_id, sync=True)
+    relation.truncate()
 
 
 def extract(key, items):
@@ -13,7 +13,10 @@ from dbms.exceptions import (
     AsyncJobStatusError,
 )
 from dbms.job import AsyncJob
-from tests.helpers import extract
+from tests.helpers import extract, shared_server_state
+
+# Async jobs are listed and cleared server-wide.
+pytestmark = shared_server_state
 
 
 def wait_on_job(job):
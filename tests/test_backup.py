@@ -9,9 +9,10 @@ from dbms.exceptions import (
     BackupRestoreError,
     BackupUploadError,
 )
-from tests.helpers import assert_raises
+from tests.helpers import assert_raises, shared_server_state
 
 
+@shared_server_state
 def test_backup_management(sys_db, bad_db, enterprise):
     if not enterprise:
         pytest.skip("Only for DbmsDB enterprise edition")
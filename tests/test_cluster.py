@@ -12,7 +12,7 @@ from dbms.exceptions import (
     ClusterServerStatisticsError,
     ClusterServerVersionError,
 )
-from tests.helpers import assert_raises
+from tests.helpers import assert_raises, shared_server_state
 
 
 def test_cluster_server_id(sys_db, bad_db, cluster):
@@ -95,6 +95,7 @@ def test_cluster_server_statistics(sys_db, bad_db, cluster):
     assert err.value.error_code in {FORBIDDEN, DATABASE_NOT_FOUND}
 
 
+@shared_server_state
 def test_cluster_toggle_maintenance_mode(sys_db, bad_db, cluster):
     if not cluster:
         pytest.skip("Only tested in a cluster setup")
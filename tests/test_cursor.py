@@ -7,7 +7,10 @@ from dbms.exceptions import (
     CursorNextError,
     CursorStateError,
 )
-from tests.helpers import clean_doc
+from tests.helpers import clean_doc, shared_server_state
+
+# Cursors report whether results came from the server-wide query cache.
+pytestmark = shared_server_state
 
 
 @pytest.fixture(autouse=True)
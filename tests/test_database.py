@@ -32,7 +32,7 @@ from dbms.exceptions import (
 from dbms.foxx import Foxx
 from dbms.replication import Replication
 from dbms.wal import WAL
-from tests.helpers import assert_raises, generate_db_name
+from tests.helpers import assert_raises, generate_db_name, shared_server_state
 
 
 def test_database_attributes(db, username):
@@ -51,6 +51,7 @@ def test_database_attributes(db, username):
     assert isinstance(db.wal, WAL)
 
 
+@shared_server_state
 def test_database_misc_methods(sys_db, db, bad_db):
     # Test get properties
     properties = db.properties()
@@ -224,6 +225,19 @@ def test_database_misc_methods(sys_db, db, bad_db):
     assert err.value.error_code in {11, 1228}
 
 
+def test_database_relation_wrapper_cache(db, col, docs):
+    col.insert_many(docs)
+    doc_1 = {"_id": f"{col.name}/{docs[0]['_key']}"}
+    doc_2 = {"_id": f"{col.name}/{docs[1]['_key']}"}
+
+    # Test document lookups through the database reuse one relation wrapper
+    assert db.has_document(doc_1) is True
+    relation = db._relations[col.name]
+    assert db.document(doc_1)["_key"] == docs[0]["_key"]
+    assert db.has_document(doc_2) is True
+    assert db._relations[col.name] is relation
+
+
 def test_database_management(db, sys_db, bad_db):
     # Test list databases
     result = sys_db.databases()
@@ -1347,6 +1347,35 @@ def test_document_has(col, bad_col, docs):
     assert err.value.error_code in {11, 1228}
 
 
+def test_document_has_many(col, bad_col, docs):
+    # Set up test documents
+    col.import_bulk(docs[:3])
+    missing_key = generate_doc_key()
+
+    # Test has_many with keys, IDs and bodies
+    assert col.has_many([]) == []
+    assert col.has_many([d["_key"] for d in docs[:3]]) == [True, True, True]
+    assert col.has_many([f"{col.name}/{d['_key']}" for d in docs]) == [
+        True,
+        True,
+        True,
+        False,
+        False,
+        False,
+    ]
+    assert col.has_many([docs[3], missing_key, docs[0]]) == [False, False, True]
+
+    # Test has_many with bad relation name in ID
+    with assert_raises(DocumentParseError) as err:
+        col.has_many([f"{generate_col_name()}/{missing_key}"])
+    assert "bad relation name" in err.value.message
+
+    # Test has_many with bad database
+    with assert_raises(DocumentInError) as err:
+        bad_col.has_many(docs)
+    assert err.value.error_code in {11, 1228}
+
+
 def test_document_get(col, bad_col, docs):
     # Set up test documents
     col.import_bulk(docs)
@@ -1625,6 +1654,21 @@ def test_document_import_bulk(col, bad_col, docs):
     assert len(result) == 1
     empty_relation(col)
 
+    # Test import bulk with batch_size and max_workers
+    results = col.import_bulk(docs, batch_size=1, max_workers=3)
+    assert len(results) == len(docs)
+    assert all(result["created"] == 1 for result in results)
+    assert len(col) == len(docs)
+    empty_relation(col)
+
+    # Test import bulk with a bad document ID in a later batch
+    bad_docs = docs + [{"_id": f"{generate_col_name()}/1"}]
+    for max_workers in (1, 3):
+        with assert_raises(DocumentParseError) as err:
+            col.import_bulk(bad_docs, batch_size=2, max_workers=max_workers)
+        assert "bad relation name" in str(err.value)
+        assert len(col) == 0
+
     # Test import bulk with overwrite and batch_size
     with pytest.raises(ValueError):
         col.import_bulk(docs, overwrite=True, batch_size=1)
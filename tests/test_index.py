@@ -128,7 +128,7 @@ def test_add_ttl_index(icol):
     icol.delete_index(result["id"])
 
 
-def test_delete_index(icol, bad_col):
+def test_delete_index(db, icol, bad_col):
     old_indexes = set(extract("id", icol.indexes()))
     icol.add_hash_index(["attr3", "attr4"], unique=True)
     icol.add_skiplist_index(["attr3", "attr4"], unique=True)
@@ -137,8 +137,14 @@ def test_delete_index(icol, bad_col):
     assert new_indexes.issuperset(old_indexes)
 
     indexes_to_delete = new_indexes - old_indexes
-    for index_id in indexes_to_delete:
-        assert icol.delete_index(index_id) is True
+    index_id, *batch_index_ids = sorted(indexes_to_delete)
+    assert icol.delete_index(index_id) is True
+
+    # Test delete the remaining indexes in a single batch request
+    with db.begin_batch_execution(return_result=True) as batch_db:
+        batch_col = batch_db.relation(icol.name)
+        jobs = [batch_col.delete_index(index_id) for index_id in batch_index_ids]
+    assert all(job.result() is True for job in jobs)
 
     new_indexes = set(extract("id", icol.indexes()))
     assert new_indexes == old_indexes
@@ -62,8 +62,9 @@ def test_permission_management(client, sys_db, bad_db, cluster):
     with assert_raises(RelationCreateError) as err:
         db.create_relation(col_name_2)
     assert err.value.http_code == 403
-    assert col_name_1 not in extract("name", db.relations())
-    assert col_name_2 not in extract("name", db.relations())
+    col_names = extract("name", db.relations())
+    assert col_name_1 not in col_names
+    assert col_name_2 not in col_names
 
     # Test reset permission (database level) with bad database
     with assert_raises(PermissionResetError) as err:
@@ -86,8 +87,9 @@ def test_permission_management(client, sys_db, bad_db, cluster):
     assert sys_db.permission(username, db_name, col_name_2) == "rw"
     assert db.create_relation(col_name_1) is not None
     assert db.create_relation(col_name_2) is not None
-    assert col_name_1 in extract("name", db.relations())
-    assert col_name_2 in extract("name", db.relations())
+    col_names = extract("name", db.relations())
+    assert col_name_1 in col_names
+    assert col_name_2 in col_names
 
     col_1 = db.relation(col_name_1)
     col_2 = db.relation(col_name_2)
@@ -1,3 +1,5 @@
+import pytest
+
 from dbms.relation import StandardRelation
 from dbms.exceptions import (
     RelationChecksumError,
@@ -16,6 +18,19 @@ from dbms.exceptions import (
 )
 from tests.helpers import assert_raises, extract, generate_col_name
 
+_RELATION_SCHEMA = {
+    "rule": {
+        "type": "object",
+        "properties": {
+            "test_attr": {"type": "string"},
+        },
+        "required": ["test_attr"],
+    },
+    "level": "moderate",
+    "message": "Schema Validation Failed.",
+    "type": "json",
+}
+
 
 def test_relation_attributes(db, col, username):
     assert col.context in ["default", "async", "batch", "transaction"]
@@ -82,22 +97,8 @@ def test_relation_misc_methods(col, bad_col, cluster):
         bad_col.unload()
     assert err.value.error_code in {11, 1228}
 
-    if cluster:
-        col.insert({})
-    else:
-        # Test checksum with empty relation
-        assert int(col.checksum(with_rev=True, with_data=False)) == 0
-        assert int(col.checksum(with_rev=True, with_data=True)) == 0
-        assert int(col.checksum(with_rev=False, with_data=False)) == 0
-        assert int(col.checksum(with_rev=False, with_data=True)) == 0
-
-        # Test checksum with non-empty relation
-        col.insert({})
-        assert int(col.checksum(with_rev=True, with_data=False)) > 0
-        assert int(col.checksum(with_rev=True, with_data=True)) > 0
-        assert int(col.checksum(with_rev=False, with_data=False)) > 0
-        assert int(col.checksum(with_rev=False, with_data=True)) > 0
-
+    col.insert({})
+    if not cluster:
         # Test checksum with bad relation
         with assert_raises(RelationChecksumError) as err:
             bad_col.checksum()
@@ -124,24 +125,27 @@ def test_relation_misc_methods(col, bad_col, cluster):
     assert err.value.error_code in {11, 1228}
 
 
+@pytest.mark.parametrize(
+    "with_rev,with_data",
+    [(True, False), (True, True), (False, False), (False, True)],
+)
+def test_relation_checksum(col, cluster, with_rev, with_data):
+    if cluster:
+        pytest.skip("Not tested in a cluster setup")
+
+    # Test checksum with empty relation
+    assert int(col.checksum(with_rev=with_rev, with_data=with_data)) == 0
+
+    # Test checksum with non-empty relation
+    col.insert({})
+    assert int(col.checksum(with_rev=with_rev, with_data=with_data)) > 0
+
+
 def test_relation_management(db, bad_db, cluster):
     # Test create relation
     col_name = generate_col_name()
     assert db.has_relation(col_name) is False
 
-    schema = {
-        "rule": {
-            "type": "object",
-            "properties": {
-                "test_attr": {"type": "string"},
-            },
-            "required": ["test_attr"],
-        },
-        "level": "moderate",
-        "message": "Schema Validation Failed.",
-        "type": "json",
-    }
-
     col = db.create_relation(
         name=col_name,
         sync=True,
@@ -155,13 +159,13 @@ def test_relation_management(db, bad_db, cluster):
         enforce_replication_factor=False,
         sharding_strategy="community-compat",
         write_concern=1,
-        schema=schema,
+        schema=_RELATION_SCHEMA,
     )
     assert db.has_relation(col_name) is True
 
     properties = col.properties()
     assert "key_options" in properties
-    assert properties["schema"] == schema
+    assert properties["schema"] == _RELATION_SCHEMA
     assert properties["name"] == col_name
     assert properties["sync"] is True
     assert properties["system"] is False
@@ -175,8 +179,7 @@ def test_relation_management(db, bad_db, cluster):
 
     # Test list relations
     assert all(
-        entry["name"].startswith("test_relation") or entry["name"].startswith("_")
-        for entry in db.relations()
+        entry["name"].startswith(("test_relation", "_")) for entry in db.relations()
     )
 
     # Test list relations with bad database
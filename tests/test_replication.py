@@ -25,7 +25,7 @@ from dbms.exceptions import (
     ReplicationServerIDError,
     ReplicationSyncError,
 )
-from tests.helpers import assert_raises
+from tests.helpers import assert_raises, shared_server_state
 
 
 def test_replication_dump_methods(db, bad_db, col, docs, cluster):
@@ -119,6 +119,7 @@ def test_replication_first_tick(sys_db, bad_db, cluster):
     assert err.value.error_code in {FORBIDDEN, DATABASE_NOT_FOUND}
 
 
+@shared_server_state
 @pytest.mark.skip(reason="FIXME: Is not adapted for DBMS")
 def test_replication_applier(sys_db, bad_db, url, cluster):
     if cluster:
@@ -212,6 +213,7 @@ def test_replication_applier(sys_db, bad_db, url, cluster):
     assert err.value.error_code in {FORBIDDEN, DATABASE_NOT_FOUND}
 
 
+@shared_server_state
 def test_replication_make_slave(sys_db, bad_db, url, replication):
     if not replication:
         pytest.skip("Only tested for replication")
@@ -267,6 +269,7 @@ def test_replication_server_id(sys_db, bad_db):
     assert err.value.error_code in {FORBIDDEN, DATABASE_NOT_FOUND}
 
 
+@shared_server_state
 def test_replication_synchronize(sys_db, bad_db, url, replication):
     if not replication:
         pytest.skip("Only tested for replication")
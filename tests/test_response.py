@@ -44,3 +44,41 @@ def test_response(conn):
     assert response.error_code == 1
     assert response.error_message == "qux"
     assert response.is_success is False
+
+
+def test_response_without_deserialize(conn):
+    # Test successful responses keep the raw body
+    test_body = '{"foo": "bar"}'
+    response = Response(
+        method="get",
+        url="test_url",
+        headers={},
+        status_text="OK",
+        status_code=200,
+        raw_body=test_body,
+    )
+    conn.prep_response(response, deserialize=False)
+
+    assert response.raw_body == test_body
+    assert response.body == response.raw_body
+    assert response.error_code is None
+    assert response.error_message is None
+    assert response.is_success is True
+
+    # Test error responses are deserialized regardless
+    test_body = '{"error": true, "errorNum": 1202, "errorMessage": "qux"}'
+    response = Response(
+        method="get",
+        url="test_url",
+        headers={},
+        status_text="Not Found",
+        status_code=404,
+        raw_body=test_body,
+    )
+    conn.prep_response(response, deserialize=False)
+
+    assert response.raw_body == test_body
+    assert response.body == {"error": True, "errorNum": 1202, "errorMessage": "qux"}
+    assert response.error_code == 1202
+    assert response.error_message == "qux"
+    assert response.is_success is False
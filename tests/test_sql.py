@@ -16,7 +16,7 @@ from dbms.exceptions import (
     SQLQueryTrackingSetError,
     SQLQueryValidateError,
 )
-from tests.helpers import assert_raises, extract
+from tests.helpers import assert_raises, extract, poll_until, shared_server_state
 
 
 def test_sql_attributes(db, username):
@@ -27,15 +27,16 @@ def test_sql_attributes(db, username):
     assert repr(db.sql.cache) == f"<SQLQueryCache in {db.name}>"
 
 
+@shared_server_state
 @pytest.mark.xfail(reason="Flaky test", strict=False)
 def test_sql_query_management(db, bad_db, col, docs):
-    plan_fields = [
+    plan_fields = {
         "estimatedNrItems",
         "estimatedCost",
         "rules",
         "variables",
         "collections",
-    ]
+    }
     # Test explain invalid query
     with assert_raises(SQLQueryExplainError) as err:
         db.sql.explain("INVALID QUERY")
@@ -47,7 +48,7 @@ def test_sql_query_management(db, bad_db, col, docs):
         all_plans=False,
         opt_rules=["-all", "+use-index-range"],
     )
-    assert all(field in plan for field in plan_fields)
+    assert plan_fields.issubset(plan)
 
     # Test explain valid query with all_plans set to True
     plans = db.sql.explain(
@@ -57,7 +58,7 @@ def test_sql_query_management(db, bad_db, col, docs):
         max_plans=10,
     )
     for plan in plans:
-        assert all(field in plan for field in plan_fields)
+        assert plan_fields.issubset(plan)
     assert len(plans) < 10
 
     # Test validate invalid query
@@ -164,8 +165,9 @@ def test_sql_query_management(db, bad_db, col, docs):
     assert new_tracking["track_slow_queries"] is True
 
     # Kick off some long lasting queries in the background
-    db.begin_async_execution().sql.execute("RETURN SLEEP(100)")
-    db.begin_async_execution().sql.execute("RETURN SLEEP(50)")
+    async_db = db.begin_async_execution()
+    async_db.sql.execute("RETURN SLEEP(100)")
+    async_db.sql.execute("RETURN SLEEP(50)")
 
     # Test list queries
     queries = db.sql.queries()
@@ -187,14 +189,10 @@ def test_sql_query_management(db, bad_db, col, docs):
     query_id_1, query_id_2 = extract("id", queries)
     assert db.sql.kill(query_id_1) is True
 
-    while len(queries) > 1:
-        queries = db.sql.queries()
-    assert query_id_1 not in extract("id", queries)
+    assert poll_until(lambda: query_id_1 not in extract("id", db.sql.queries()))
 
     assert db.sql.kill(query_id_2) is True
-    while len(queries) > 0:
-        queries = db.sql.queries()
-    assert query_id_2 not in extract("id", queries)
+    assert poll_until(lambda: query_id_2 not in extract("id", db.sql.queries()))
 
     # Test kill missing queries
     with assert_raises(SQLQueryKillError) as err:
@@ -292,9 +290,11 @@ def test_sql_function_management(db, bad_db):
     assert db.sql.functions() == []
 
 
+@shared_server_state
 def test_sql_cache_management(db, bad_db):
     # Test get SQL cache properties
     properties = db.sql.cache.properties()
+    original_properties = dict(properties)
     assert "mode" in properties
     assert "max_results" in properties
     assert "max_results_size" in properties
@@ -305,45 +305,49 @@ def test_sql_cache_management(db, bad_db):
     with assert_raises(SQLCachePropertiesError):
         bad_db.sql.cache.properties()
 
-    # Test get SQL cache configure properties
-    properties = db.sql.cache.configure(
-        mode="on",
-        max_results=100,
-        max_results_size=10000,
-        max_entry_size=10000,
-        include_system=True,
-    )
-    assert properties["mode"] == "on"
-    assert properties["max_results"] == 100
-    assert properties["max_results_size"] == 10000
-    assert properties["max_entry_size"] == 10000
-    assert properties["include_system"] is True
-
-    properties = db.sql.cache.properties()
-    assert properties["mode"] == "on"
-    assert properties["max_results"] == 100
-    assert properties["max_results_size"] == 10000
-    assert properties["max_entry_size"] == 10000
-    assert properties["include_system"] is True
-
-    # Test get SQL cache configure properties with bad database
-    with assert_raises(SQLCacheConfigureError):
-        bad_db.sql.cache.configure(mode="on")
-
-    # Test get SQL cache entries
-    result = db.sql.cache.entries()
-    assert isinstance(result, list)
-
-    # Test get SQL cache entries with bad database
-    with assert_raises(SQLCacheEntriesError) as err:
-        bad_db.sql.cache.entries()
-    assert err.value.error_code in {11, 1228}
-
-    # Test get SQL cache clear
-    result = db.sql.cache.clear()
-    assert isinstance(result, bool)
-
-    # Test get SQL cache clear with bad database
-    with assert_raises(SQLCacheClearError) as err:
-        bad_db.sql.cache.clear()
-    assert err.value.error_code in {11, 1228}
+    # Restore the server-wide cache settings, other tests depend on them
+    try:
+        # Test get SQL cache configure properties
+        properties = db.sql.cache.configure(
+            mode="on",
+            max_results=100,
+            max_results_size=10000,
+            max_entry_size=10000,
+            include_system=True,
+        )
+        assert properties["mode"] == "on"
+        assert properties["max_results"] == 100
+        assert properties["max_results_size"] == 10000
+        assert properties["max_entry_size"] == 10000
+        assert properties["include_system"] is True
+
+        properties = db.sql.cache.properties()
+        assert properties["mode"] == "on"
+        assert properties["max_results"] == 100
+        assert properties["max_results_size"] == 10000
+        assert properties["max_entry_size"] == 10000
+        assert properties["include_system"] is True
+
+        # Test get SQL cache configure properties with bad database
+        with assert_raises(SQLCacheConfigureError):
+            bad_db.sql.cache.configure(mode="on")
+
+        # Test get SQL cache entries
+        result = db.sql.cache.entries()
+        assert isinstance(result, list)
+
+        # Test get SQL cache entries with bad database
+        with assert_raises(SQLCacheEntriesError) as err:
+            bad_db.sql.cache.entries()
+        assert err.value.error_code in {11, 1228}
+
+        # Test get SQL cache clear
+        result = db.sql.cache.clear()
+        assert isinstance(result, bool)
+
+        # Test get SQL cache clear with bad database
+        with assert_raises(SQLCacheClearError) as err:
+            bad_db.sql.cache.clear()
+        assert err.value.error_code in {11, 1228}
+    finally:
+        db.sql.cache.configure(**original_properties)